@@ -0,0 +1,357 @@
+import asyncio
+import functools
+import logging
+import sys
+from typing import Dict, Optional, Tuple
+
+from environs import Env
+from pydantic import ValidationError, BaseModel
+
+from .object_values.args import MarketInputArgs, LimitInputArgs
+
+# The client drags in binance and aiohttp (~100 ms of cold import);
+# main() imports it on demand so --help and argument-validation
+# failures never pay for it
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def get_binance_keys() -> Tuple[str, str]:
+    """
+    Read the Binance keys once: the .env parse happens on first use
+    instead of at import, and repeat callers hit the cache.
+    """
+    env = Env()
+    env.read_env()
+
+    api_key = env.str("API_KEY", None)
+    secret_key = env.str("SECRET_KEY", None)
+    if api_key is None or secret_key is None:
+        sys.exit("Either `API_KEY` or `SECRET_KEY` env. variable is not defined!")
+    return api_key, secret_key
+
+
+async def execute_strategies(client, input_args: BaseModel) -> None:
+    """Run the buy then sell strategy for one validated order."""
+    from .object_values.orders import SIDE_BUY, order_types_for_symbol
+    from .object_values.strategy import SellFactors
+    from .tools import get_formated_price
+
+    symbol = await client.get_symbol(input_args.symbol)
+
+    # Computed once for the whole run
+    sell_factors = SellFactors.from_percentages(
+        profit=input_args.profit,
+        loss=input_args.loss,
+    )
+
+    # Order classes specialized for the symbol: the filter bounds are
+    # compiled into the field constraints
+    limit_order_type, market_order_type = order_types_for_symbol(symbol)
+
+    # Place a market buy order
+    if input_args.buy_type == "limit":
+        buy_order = limit_order_type(
+            symbol=symbol,
+            side=SIDE_BUY,
+            price=input_args.price,
+            quantity=input_args.quantity
+        )
+
+    elif input_args.buy_type == "market":
+        buy_order = market_order_type(
+            symbol=symbol,
+            side=SIDE_BUY,
+            total=input_args.total
+        )
+    else:
+        sys.exit("Buy order type not supported")
+
+    # A limit order fills at its own price, so the sell OCO can be
+    # prepared while the fill is awaited
+    prepared_oco_order = None
+    if input_args.buy_type == "limit":
+        prepared_oco_order = client.prepare_sell_oco_order(
+            symbol=symbol,
+            bought_price=buy_order.price,
+            quantity=buy_order.quantity,
+            sell_factors=sell_factors,
+        )
+
+    order_in_progress = await client.execute_buy_strategy(buy_order)
+    logger.info("=========================")
+    logger.info("=== Buy order summary ===")
+    logger.info(
+        "=> Buy price: %s %s",
+        get_formated_price(order_in_progress.info.price, symbol.price_decimal_precision),
+        symbol.quoteAsset,
+    )
+    logger.info(
+        "=> Total price: %s %s",
+        get_formated_price(order_in_progress.info.cummulative_quote_quantity, symbol.price_decimal_precision),
+        symbol.quoteAsset,
+    )
+    logger.info(
+        "=> Buy quantity: %s %s",
+        get_formated_price(order_in_progress.info.executed_quantity, symbol.qty_decimal_precision),
+        symbol.baseAsset,
+    )
+
+    stop_loss_limit_order, limit_maker_order = await client.execute_sell_strategy(
+        order_in_progress,
+        sell_factors,
+        prepared_oco_order=prepared_oco_order,
+    )
+
+    logger.info("=========================")
+    logger.info("=== OCO order summary ===")
+    logger.info("== Stop loss limit order: %s", stop_loss_limit_order)
+    logger.info("== Limit maker order: %s", limit_maker_order)
+
+
+async def main(input_args: BaseModel) -> None:
+    from .client import Client
+
+    api_key, secret_key = get_binance_keys()
+    client = await Client.create(api_key=api_key, api_secret=secret_key)
+    await execute_strategies(client, input_args)
+    await client.close()
+
+
+async def serve() -> None:
+    """
+    Long-lived mode: keep one authenticated client (and its symbol
+    caches) warm and execute one JSON order per stdin line, e.g.
+        {"symbol": "BTCEUR", "buy_type": "limit", "price": "...", ...}
+    so repeated orders skip the per-run authentication and metadata
+    round-trips.
+    """
+    import json
+
+    from .client import Client
+
+    api_key, secret_key = get_binance_keys()
+    client = await Client.create(api_key=api_key, api_secret=secret_key)
+    loop = asyncio.get_running_loop()
+
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            raw_args = json.loads(line)
+            input_parser = (
+                MarketInputArgs
+                if raw_args.get("buy_type") == "market"
+                else LimitInputArgs
+            )
+            input_args = input_parser(**raw_args)
+        except (ValueError, ValidationError) as e:
+            logger.error("Invalid order line: %s", e)
+            continue
+
+        # Guarded so a failing order (including the client's sys.exit
+        # paths) cannot tear down the warm client between lines
+        await _execute_strategies_guarded(client, input_args)
+
+    await client.close()
+
+
+async def _execute_strategies_guarded(client, input_args: BaseModel) -> None:
+    """
+    Run the strategies for one order, containing its failures: the
+    client's fatal paths raise SystemExit, which asyncio.gather
+    re-raises even with return_exceptions=True and which would tear
+    down every sibling order sharing the loop. Both are turned into a
+    logged error so the long-lived modes keep going.
+    """
+    try:
+        await execute_strategies(client, input_args)
+    except SystemExit as e:
+        logger.error("Order on %s aborted: %s", input_args.symbol, e)
+    except Exception as e:
+        logger.error("Order on %s failed: %s", input_args.symbol, e)
+
+
+async def run_batch(batch_file: str) -> None:
+    """
+    Execute every order of a JSON-lines file concurrently over one
+    client (same line format as serve). Dispatching with gather means
+    the batch completes in roughly the slowest order's time instead of
+    the sum; the client's submission semaphore enforces the Binance
+    10-orders-per-second limit, so no extra throttling is needed here.
+    """
+    import orjson
+
+    from .client import Client
+
+    api_key, secret_key = get_binance_keys()
+    client = await Client.create(api_key=api_key, api_secret=secret_key)
+
+    orders = []
+    with open(batch_file, "rb") as batch:
+        for line_number, line in enumerate(batch, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                raw_args = orjson.loads(line)
+                input_parser = (
+                    MarketInputArgs
+                    if raw_args.get("buy_type") == "market"
+                    else LimitInputArgs
+                )
+                orders.append(input_parser(**raw_args))
+            except (ValueError, ValidationError) as e:
+                logger.error("Skipping invalid order line %s: %s", line_number, e)
+
+    await asyncio.gather(
+        *(_execute_strategies_guarded(client, input_args) for input_args in orders)
+    )
+
+    await client.close()
+
+
+def input_validation(raw_input_args, input_parser: BaseModel) -> BaseModel:
+
+    try:
+        cleaned_input_args = input_parser(**raw_input_args)
+    except ValidationError as e:
+        sys.exit(e)
+    else:
+        return cleaned_input_args
+
+
+# The complete flag set, kept in sync with the argparse fallback below
+CLI_FLAGS = (
+    "--symbol",
+    "--buy_type",
+    "--total",
+    "--quantity",
+    "--price",
+    "--profit",
+    "--loss",
+)
+
+
+def parse_args_fast(argv) -> Optional[Dict]:
+    """
+    Hand-rolled parser for the fixed '--flag value' shape: no argparse
+    import, no parser construction, ~20 ms less per invocation.
+    Returns None when the argv shape is unexpected (help request,
+    unknown flag, missing value...) so the caller can fall back to
+    argparse for proper diagnostics.
+    """
+    if not argv or len(argv) % 2:
+        return None
+
+    args = dict.fromkeys(flag[2:] for flag in CLI_FLAGS)
+    for flag, value in zip(argv[::2], argv[1::2]):
+        if flag not in CLI_FLAGS or value.startswith("--"):
+            return None
+        args[flag[2:]] = value
+
+    if args["symbol"] is None or args["buy_type"] not in ("market", "limit"):
+        return None
+    return args
+
+
+def parse_args_argparse() -> Dict:
+    """Full argparse path: --help, error messages and validation."""
+    import argparse
+
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--symbol",
+        required=True,
+        help="define the symbol of the crypto pair to trade"
+    )
+    parser.add_argument(
+        "--buy_type",
+        required=True,
+        choices=["market", "limit"],
+        help="define the type of buy order to execute: limit or market"
+    )
+    parser.add_argument(
+        "--total",
+        required=False,
+        help="define the total amount to spend"
+    )
+    parser.add_argument(
+        "--quantity",
+        required=False,
+        help="define the quantity to buy (decimal number)"
+    )
+    parser.add_argument(
+        "--price",
+        required=False,
+        help="define the unit price to spend"
+    )
+    parser.add_argument(
+        "--profit",
+        required=False,
+        help="define the profit to make in percentage between 0 and 100"
+    )
+    parser.add_argument(
+        "--loss",
+        required=False,
+        help="define the stoploss in percentage between 0 and 100"
+    )
+
+    return vars(parser.parse_args())
+
+
+def setup_logging() -> None:
+    """
+    Route log records through a queue drained by a background
+    listener writing to stderr: the event-loop thread only enqueues,
+    so terminal I/O never blocks or jitters the order coroutines.
+    """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
+
+def entrypoint() -> None:
+    """Parse the CLI arguments and run the requested mode."""
+    setup_logging()
+
+    if sys.argv[1:] == ["serve"]:
+        asyncio.run(serve())
+        sys.exit(0)
+
+    if sys.argv[1:2] == ["--batch-file"] and len(sys.argv) == 3:
+        asyncio.run(run_batch(sys.argv[2]))
+        sys.exit(0)
+
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = parse_args_argparse()
+
+    if args["buy_type"] == "market":
+        input_args_validated = input_validation(args, MarketInputArgs)
+    elif args["buy_type"] == "limit":
+        input_args_validated = input_validation(args, LimitInputArgs)
+    else:
+        sys.exit("The buy type argument is unknown")
+
+    asyncio.run(main(input_args=input_args_validated))
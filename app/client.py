@@ -1,13 +1,23 @@
 from typing import Union, List, Dict, Optional
-from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
 
+import asyncio
+import functools
+import json
+import logging
+import random
 import sys
 import time
+from pathlib import Path
 
-from binance.client import Client as BinanceClient
-from binance.exceptions import BinanceAPIException
-from binance.enums import TIME_IN_FORCE_GTC
+import aiohttp
+import orjson
+
+from cachetools import TTLCache
+
+from binance import AsyncClient, BinanceSocketManager
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance.enums import SIDE_SELL, TIME_IN_FORCE_GTC
 
 
 from .object_values.filters import (
@@ -18,67 +28,293 @@ from .object_values.filters import (
     MarketLotSizeFilter,
 )
 from .object_values.orders import (
+    SIDE_SELL as ORDER_SIDE_SELL,
     Order,
     LimitOrder,
     MarketOrder,
     OrderInfo,
     OCOOrder
 )
+from .object_values.strategy import SellFactors
 from .object_values.symbol import Symbol
 from .entities import OrderInProgress
 
 from .tools import (
     get_formated_price,
-    datetime_to_iso8601,
     decimal_precision_from_scientific_notation
 )
 
 MULT_MILLISECONDS_TO_SECONDS = 1000
 
+# Statuses after which an order will not be updated anymore
+TERMINAL_ORDER_STATUSES = ("FILLED", "CANCELED")
+# Maximum time (seconds) to wait for an executionReport event
+# before falling back to REST polling
+USER_STREAM_TIMEOUT = 60
+
+# The update buffers also receive executionReports nobody awaits (the
+# OCO sell legs report through the same stream), so they are bounded;
+# the TTL sits comfortably above USER_STREAM_TIMEOUT so an entry can
+# never expire under an active waiter
+ORDER_UPDATE_CACHE_SIZE = 1024
+ORDER_UPDATE_CACHE_TTL = 2 * USER_STREAM_TIMEOUT
+
+# Binance hard limit on order placement rate
+MAX_ORDERS_PER_SECOND = 10
+
+# Exchange info changes rarely, so it can live for an hour; the
+# average price feeds the percent-price band, so it is kept for a few
+# seconds only — enough to absorb back-to-back orders on one symbol
+# without ever using a stale band (TTLs in seconds)
+SYMBOL_INFO_CACHE_TTL = 3600
+AVG_PRICE_CACHE_TTL = 5
+METADATA_CACHE_SIZE = 256
+
+# On-disk layer of the symbol-info cache, so warm re-runs of the script
+# skip the exchange-info round-trip entirely
+SYMBOL_INFO_CACHE_PATH = (
+    Path.home() / ".cache" / "python-binance-profit" / "symbol_info.json"
+)
+
+# Shared aiohttp connection pool settings: keep connections warm so
+# consecutive REST calls reuse the same TLS session
+CONNECTION_POOL_SIZE = 50
+CONNECTION_KEEPALIVE_TIMEOUT = 75
+# Bound every REST call so a stalled connection cannot hang the
+# strategy; retries are handled by the callers
+REQUEST_TIMEOUT = 10
+
+logger = logging.getLogger(__name__)
+
+# Fallback polling backoff: start fast to catch quick fills, double up
+# to the cap, with +/-20% jitter to avoid synchronized retries
+POLL_INITIAL_DELAY = 0.2
+POLL_MAX_DELAY = 2.0
+POLL_JITTER = 0.2
+
+# Binance error code returned while a freshly placed order has not
+# propagated to the query endpoints yet; retried on a short schedule
+# (total budget under one second) instead of the connection backoff
+ORDER_NOT_FOUND_ERROR_CODE = -2013
+ORDER_VISIBILITY_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)
+
+
+class _OrjsonAsyncClient(AsyncClient):
+    """
+    AsyncClient decoding responses with orjson: the exchangeInfo
+    payload is tens of KB and stdlib json is the CPU cost of every
+    REST call that is not network wait.
+    """
+
+    async def _handle_response(self, response: aiohttp.ClientResponse):
+        if not str(response.status).startswith('2'):
+            raise BinanceAPIException(
+                response, response.status, await response.text()
+            )
+        try:
+            return orjson.loads(await response.read())
+        except ValueError:
+            txt = await response.text()
+            raise BinanceRequestException(f'Invalid Response: {txt}')
+
 
 class Client:
 
     def __init__(
         self,
+        binance_client: AsyncClient,
+    ) -> None:
+        """
+        Initialize the Binance client wrapper.
+        Args:
+            binance_client (AsyncClient): connected binance api client
+        Return:
+            None
+        """
+        self.binance_client = binance_client
+
+        # Bind the constant OCO kwargs once instead of rebuilding the
+        # full keyword dict on every submission
+        self._submit_sell_oco = functools.partial(
+            binance_client.create_oco_order,
+            side=SIDE_SELL,
+            stopLimitTimeInForce=TIME_IN_FORCE_GTC,
+        )
+
+        # The user data stream pushes an executionReport event as soon
+        # as an order changes state, so order fills are detected without
+        # polling the REST API. Updates are buffered per order id so an
+        # event arriving before the strategy starts waiting (the stream
+        # is subscribed before any order is placed) is never lost.
+        # TTL-bounded: awaited entries are popped by the waiter, and
+        # the ones nobody claims expire instead of accumulating over a
+        # long-lived serve/batch session.
+        self._order_updates: TTLCache = TTLCache(
+            maxsize=ORDER_UPDATE_CACHE_SIZE,
+            ttl=ORDER_UPDATE_CACHE_TTL
+        )
+        self._order_update_received: TTLCache = TTLCache(
+            maxsize=ORDER_UPDATE_CACHE_SIZE,
+            ttl=ORDER_UPDATE_CACHE_TTL
+        )
+        self._user_stream_task: Optional[asyncio.Task] = None
+
+        # Order submissions share a semaphore released on a 1 second
+        # timer so the Binance order rate limit is never exceeded
+        self._order_slots = asyncio.Semaphore(MAX_ORDERS_PER_SECOND)
+
+        # Memoize the per-symbol metadata so repeated lookups within
+        # the TTL skip the REST round-trip
+        self._symbol_info_cache: TTLCache = TTLCache(
+            maxsize=METADATA_CACHE_SIZE,
+            ttl=SYMBOL_INFO_CACHE_TTL
+        )
+        self._avg_price_cache: TTLCache = TTLCache(
+            maxsize=METADATA_CACHE_SIZE,
+            ttl=AVG_PRICE_CACHE_TTL
+        )
+
+    @classmethod
+    async def create(
+        cls,
         api_key: str,
         api_secret: str,
-    ) -> None:
+    ) -> "Client":
         """
-        Initialize the Binance client
+        Connect the Binance client and start the user data stream.
         Args:
             api_key (str): api key for binance api client
             api_secret (str): api secret for binance api client
         Return:
-            None
+            Client
         """
-
-        self.binance_client = BinanceClient(
+        binance_client = await _OrjsonAsyncClient.create(
             api_key=api_key,
-            api_secret=api_secret
+            api_secret=api_secret,
+            session_params={
+                "connector": aiohttp.TCPConnector(
+                    limit=CONNECTION_POOL_SIZE,
+                    keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                ),
+                "timeout": aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            },
+        )
+        client = cls(binance_client=binance_client)
+        client._user_stream_task = asyncio.create_task(
+            client._listen_user_stream()
         )
 
-        server_time_utc_iso8601 = datetime_to_iso8601(
-            self.get_binance_api_server_time()
+        # The two startup calls are independent: fire them together so
+        # initialization costs one round-trip instead of two
+        server_time_utc_iso8601, api_is_live = await asyncio.gather(
+            client.get_binance_api_server_time(),
+            client.is_binance_api_live(),
         )
-        print(f"Binance API Time: {server_time_utc_iso8601}")
+        logger.info("Binance API Time: %s", server_time_utc_iso8601)
 
-        if not self.is_binance_api_live():
+        if not api_is_live:
             sys.exit("Binance API is down")
-        print("Binance API is up")
+        logger.info("Binance API is up")
+
+        return client
+
+    async def close(self) -> None:
+        """Stop the user data stream and release the HTTP session."""
+        if self._user_stream_task:
+            self._user_stream_task.cancel()
+            try:
+                await self._user_stream_task
+            except asyncio.CancelledError:
+                pass
+        await self.binance_client.close_connection()
+
+    async def _listen_user_stream(self) -> None:
+        """
+        Listen to the user data stream and queue the order update
+        events it pushes.
+        """
+        socket_manager = BinanceSocketManager(self.binance_client)
+        async with socket_manager.user_socket() as stream:
+            while True:
+                message = await stream.recv()
+                if message.get("e") == "executionReport":
+                    order_id = message["i"]
+                    self._order_updates[order_id] = message
+                    self._order_update_received.setdefault(
+                        order_id,
+                        asyncio.Event()
+                    ).set()
+
+    async def _wait_for_order_update(
+        self,
+        order_id: int,
+        statuses: tuple,
+        timeout: float,
+    ) -> Optional[Dict]:
+        """
+        Wait for an executionReport event matching an order id and status.
+        Args:
+            order_id (int): id of the order to watch
+            statuses (tuple): order statuses to wait for
+            timeout (float): maximum time to wait, in seconds
+        Return:
+            Dict with the matching event, or None on timeout
+        """
+        update_received = self._order_update_received.setdefault(
+            order_id,
+            asyncio.Event()
+        )
+        try:
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    await asyncio.wait_for(
+                        update_received.wait(),
+                        timeout=remaining
+                    )
+                except asyncio.TimeoutError:
+                    break
+                message = self._order_updates[order_id]
+                if message["X"] in statuses:
+                    return message
+                # Non-terminal update (e.g. PARTIALLY_FILLED): keep waiting
+                update_received.clear()
+            return None
+        finally:
+            self._order_update_received.pop(order_id, None)
+            self._order_updates.pop(order_id, None)
+
+    async def _acquire_order_slot(self) -> None:
+        """
+        Take an order submission slot, released one second later so no
+        more than MAX_ORDERS_PER_SECOND orders are sent per second.
+        """
+        await self._order_slots.acquire()
+        asyncio.get_running_loop().call_later(
+            1.0,
+            self._order_slots.release
+        )
 
-    def get_binance_api_server_time(self) -> datetime:
-        """Retrieve Binance API UTC server time as a datetime."""
-        server_time_unix_epoch = self.binance_client.get_server_time()
-        server_time_utc_datetime = datetime.utcfromtimestamp(
-            server_time_unix_epoch["serverTime"]/MULT_MILLISECONDS_TO_SECONDS
+    async def get_binance_api_server_time(self) -> str:
+        """Retrieve Binance API UTC server time as an iso8601 string."""
+        server_time_unix_epoch = await self.binance_client.get_server_time()
+        # time.strftime formats at C level without building an
+        # intermediate datetime object (utcfromtimestamp is also
+        # deprecated since Python 3.12)
+        return time.strftime(
+            '%Y-%m-%d %H:%M:%SZ',
+            time.gmtime(
+                server_time_unix_epoch["serverTime"]
+                // MULT_MILLISECONDS_TO_SECONDS
+            )
         )
-        return server_time_utc_datetime
 
-    def is_binance_api_live(self) -> bool:
+    async def is_binance_api_live(self) -> bool:
         """Get binance api status."""
-        return not bool(self.binance_client.get_system_status()["status"])
+        system_status = await self.binance_client.get_system_status()
+        return system_status["status"] == 0
 
-    def get_symbol(self, symbol_name: str) -> Symbol:
+    async def get_symbol(self, symbol_name: str) -> Symbol:
         """
         Set the information about a symbol.
         Args:
@@ -86,14 +322,25 @@ class Client:
         Return:
             Symbol
         """
-        symbol_info = self.binance_client.get_symbol_info(symbol_name)
+        # The symbol info and average price are independent lookups:
+        # issue them together over the shared session. Exceptions are
+        # collected rather than raised so an unknown symbol (which
+        # fails the avgPrice call with -1121) still reaches the clean
+        # "no info" exit below instead of surfacing a raw traceback
+        symbol_info, avg_price = await asyncio.gather(
+            self._get_symbol_info(symbol_name),
+            self.get_avg_symbol_price(symbol_name),
+            return_exceptions=True,
+        )
+        if isinstance(symbol_info, BaseException):
+            raise symbol_info
         if not symbol_info:
             sys.exit(f"No info found for the symbol {symbol_name}")
+        if isinstance(avg_price, BaseException):
+            raise avg_price
 
         filters = self._get_filters(symbol_info["filters"])
 
-        avg_price = self.get_avg_symbol_price(symbol_name)
-
         price_round = decimal_precision_from_scientific_notation(
             filters.price_filter.min_price
         )
@@ -110,7 +357,12 @@ class Client:
             ocoAllowed=symbol_info['isSpotTradingAllowed'],
             price_decimal_precision=price_round,
             qty_decimal_precision=qty_round,
+            # Precomputed once so the sell prices can be rounded with
+            # a single quantize call
+            price_quantum=Decimal(1).scaleb(-price_round),
             average_price=avg_price,
+            price_lower_limit=avg_price * filters.percent_price_filter.mul_down,
+            price_upper_limit=avg_price * filters.percent_price_filter.mul_up,
             filters=filters
         )
         if (
@@ -118,18 +370,77 @@ class Client:
             or not symbol.isSpotTradingAllowed
         ):
             sys.exit("Spot trading is not allowed on this pair")
-        print("Trading allowed")
+        logger.info("Trading allowed")
 
         if not symbol.ocoAllowed:
             sys.exit("OCO order is not allowed on this pair")
 
-        print("OCO orders allowed")
+        logger.info("OCO orders allowed")
         return symbol
 
-    def get_avg_symbol_price(self, symbol_name: str) -> Decimal:
-        return Decimal(
-            self.binance_client.get_avg_price(symbol=symbol_name)['price']
-        )
+    async def _get_symbol_info(self, symbol_name: str) -> Optional[Dict]:
+        """
+        Retrieve the symbol info, memoized per symbol with a TTL.
+        Misses fall through to a small on-disk cache before hitting the
+        REST API, so repeated runs within the TTL skip the round-trip.
+        """
+        try:
+            return self._symbol_info_cache[symbol_name]
+        except KeyError:
+            pass
+
+        symbol_info = self._read_symbol_info_from_disk(symbol_name)
+        if symbol_info is None:
+            symbol_info = await self.binance_client.get_symbol_info(
+                symbol_name
+            )
+            self._write_symbol_info_to_disk(symbol_name, symbol_info)
+        self._symbol_info_cache[symbol_name] = symbol_info
+        return symbol_info
+
+    @staticmethod
+    def _read_symbol_info_from_disk(symbol_name: str) -> Optional[Dict]:
+        """Return the cached symbol info if still within the TTL."""
+        try:
+            cached = json.loads(SYMBOL_INFO_CACHE_PATH.read_text())
+            entry = cached[symbol_name]
+            if time.time() - entry["fetched_at"] < SYMBOL_INFO_CACHE_TTL:
+                return entry["info"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    @staticmethod
+    def _write_symbol_info_to_disk(
+        symbol_name: str,
+        symbol_info: Optional[Dict]
+    ) -> None:
+        """Best effort: a failed write only costs the warm start."""
+        if symbol_info is None:
+            return
+        try:
+            try:
+                cached = json.loads(SYMBOL_INFO_CACHE_PATH.read_text())
+            except (OSError, ValueError):
+                cached = {}
+            cached[symbol_name] = {
+                "fetched_at": time.time(),
+                "info": symbol_info,
+            }
+            SYMBOL_INFO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            SYMBOL_INFO_CACHE_PATH.write_text(json.dumps(cached))
+        except OSError:
+            logger.debug("Could not persist the symbol info cache")
+
+    async def get_avg_symbol_price(self, symbol_name: str) -> Decimal:
+        try:
+            return self._avg_price_cache[symbol_name]
+        except KeyError:
+            avg_price = Decimal(
+                (await self.binance_client.get_avg_price(symbol=symbol_name))['price']
+            )
+            self._avg_price_cache[symbol_name] = avg_price
+            return avg_price
 
     def _get_filters(
         self,
@@ -144,28 +455,37 @@ class Client:
             Filters
         """
 
+        # Index the filters by their semantic key once, instead of
+        # relying on the positional order Binance returns them in
+        filters_by_type = {
+            symbol_filter["filterType"]: symbol_filter
+            for symbol_filter in symbol_filters
+        }
+
+        # Parse the string fields to Decimal here, once per symbol,
+        # so the validators never compare against raw strings
         price_filter = PriceFilter(
-            min_price=symbol_filters[0]["minPrice"],
-            max_price=symbol_filters[0]["maxPrice"],
-            tick_size=symbol_filters[0]["tickSize"],
+            min_price=Decimal(filters_by_type["PRICE_FILTER"]["minPrice"]),
+            max_price=Decimal(filters_by_type["PRICE_FILTER"]["maxPrice"]),
+            tick_size=Decimal(filters_by_type["PRICE_FILTER"]["tickSize"]),
         )
 
         percent_price_filter = PercentPriceFilter(
-            mul_up=symbol_filters[1]["multiplierUp"],
-            mul_down=symbol_filters[1]["multiplierDown"],
-            avg_price_mins=symbol_filters[1]["avgPriceMins"]
+            mul_up=Decimal(filters_by_type["PERCENT_PRICE"]["multiplierUp"]),
+            mul_down=Decimal(filters_by_type["PERCENT_PRICE"]["multiplierDown"]),
+            avg_price_mins=Decimal(filters_by_type["PERCENT_PRICE"]["avgPriceMins"])
         )
 
         lot_size_filter = LotSizeFilter(
-            min_qty=symbol_filters[2]["minQty"],
-            max_qty=symbol_filters[2]["maxQty"],
-            step_size=symbol_filters[2]["stepSize"]
+            min_qty=Decimal(filters_by_type["LOT_SIZE"]["minQty"]),
+            max_qty=Decimal(filters_by_type["LOT_SIZE"]["maxQty"]),
+            step_size=Decimal(filters_by_type["LOT_SIZE"]["stepSize"])
         )
 
         market_lot_size_filter = MarketLotSizeFilter(
-            min_qty=symbol_filters[5]["minQty"],
-            max_qty=symbol_filters[5]["maxQty"],
-            step_size=symbol_filters[5]["stepSize"]
+            min_qty=Decimal(filters_by_type["MARKET_LOT_SIZE"]["minQty"]),
+            max_qty=Decimal(filters_by_type["MARKET_LOT_SIZE"]["maxQty"]),
+            step_size=Decimal(filters_by_type["MARKET_LOT_SIZE"]["stepSize"])
         )
 
         return Filters(
@@ -175,7 +495,7 @@ class Client:
             market_lot_size_filter=market_lot_size_filter,
         )
 
-    def create_market_buy_order(
+    async def create_market_buy_order(
         self,
         order: MarketOrder
     ) -> Optional[OrderInProgress]:
@@ -187,7 +507,8 @@ class Client:
             OrderInProgress
         """
         try:
-            buy_order = self.binance_client.order_market_buy(
+            await self._acquire_order_slot()
+            buy_order = await self.binance_client.order_market_buy(
                 symbol=order.symbol.symbol,
                 quoteOrderQty=order.total,
             )
@@ -195,16 +516,16 @@ class Client:
                 id=buy_order["orderId"],
                 order=order
             )
-            print("The market order has been sent")
+            logger.info("The market order has been sent")
 
         except BinanceAPIException as e:
-            print(f"(Code {e.status_code}) {e.message}")
+            logger.error("(Code %s) %s", e.status_code, e.message)
             return None
 
         else:
             return order_in_progress
 
-    def create_limit_buy_order(
+    async def create_limit_buy_order(
         self,
         order: LimitOrder,
     ) -> Optional[OrderInProgress]:
@@ -216,7 +537,8 @@ class Client:
             OrderInProgress
         """
         try:
-            buy_order = self.binance_client.order_limit_buy(
+            await self._acquire_order_slot()
+            buy_order = await self.binance_client.order_limit_buy(
                 symbol=order.symbol.symbol,
                 quantity=order.quantity,
                 price=order.price,
@@ -225,16 +547,16 @@ class Client:
                 id=buy_order["orderId"],
                 order=order
             )
-            print("-> The limit buy order has been sent")
+            logger.info("-> The limit buy order has been sent")
 
         except BinanceAPIException as e:
-            print(f"(Code {e.status_code}) {e.message}")
+            logger.error("(Code %s) %s", e.status_code, e.message)
             return None
 
         else:
             return order_in_progress
 
-    def create_sell_oco_order(
+    async def create_sell_oco_order(
         self,
         order: OCOOrder,
     ) -> Dict:
@@ -246,25 +568,24 @@ class Client:
             Dict
         """
         try:
-            sell_order = self.binance_client.create_oco_order(
+            await self._acquire_order_slot()
+            sell_order = await self._submit_sell_oco(
                 symbol=order.symbol.symbol,
-                side=order.side,
                 quantity=order.quantity,
                 price=order.price,
                 stopPrice=order.stop_price,
                 stopLimitPrice=order.stop_limit_price,
-                stopLimitTimeInForce=order.time_in_force
             )
-            print("-> The sell oco order has been sent")
+            logger.info("-> The sell oco order has been sent")
 
         except BinanceAPIException as e:
-            print(f"(Code {e.status_code}) {e.message}")
+            logger.error("(Code %s) %s", e.status_code, e.message)
             return {}
 
         else:
             return sell_order
 
-    def cancel_open_order(
+    async def cancel_open_order(
         self,
         order_in_progress: OrderInProgress,
     ) -> Dict:
@@ -276,19 +597,20 @@ class Client:
             Dict
         """
         try:
-            cancel_result = self.binance_client.cancel_order(
+            await self._acquire_order_slot()
+            cancel_result = await self.binance_client.cancel_order(
                 symbol=order_in_progress.order.symbol.symbol,
                 orderId=order_in_progress.id
             )
 
         except BinanceAPIException as e:
-            print(f"(Code {e.status_code}) {e.message}")
+            logger.error("(Code %s) %s", e.status_code, e.message)
             return {}
 
         else:
             return cancel_result
 
-    def execute_buy_strategy(
+    async def execute_buy_strategy(
         self,
         order: Order,
     ) -> OrderInProgress:
@@ -300,64 +622,148 @@ class Client:
             OrderInProgress
         """
 
-        print("=> Step 1 - Buy order execution")
+        logger.info("=> Step 1 - Buy order execution")
 
         if isinstance(order, LimitOrder):
-            if not (buy_order_in_progress := self.create_limit_buy_order(order)):
+            if not (buy_order_in_progress := await self.create_limit_buy_order(order)):
                 sys.exit("Limit buy order has not been created")
 
         elif isinstance(order, MarketOrder):
-            if not (buy_order_in_progress := self.create_market_buy_order(order)):
+            if not (buy_order_in_progress := await self.create_market_buy_order(order)):
                 sys.exit("Market buy order has not been created")
         else:
             sys.exit("Order type not supported yet.")
 
-        # Wait for few seconds (API may not find the order_id instantly after the executing)
-        time.sleep(3)
+        logger.info("Waiting for the buy order to be filled...")
+        order_update = await self._wait_for_order_update(
+            order_id=buy_order_in_progress.id,
+            statuses=TERMINAL_ORDER_STATUSES,
+            timeout=USER_STREAM_TIMEOUT,
+        )
+        if order_update:
+            order_info = self._order_info_from_execution_report(
+                order=buy_order_in_progress.order,
+                message=order_update,
+            )
+            if order_info is not None:
+                buy_order_in_progress.info = order_info
+            else:
+                await self.update_order_info(
+                    order_in_progress=buy_order_in_progress
+                )
+        else:
+            logger.warning("No update received from the user data stream, polling the order...")
+            await self._poll_order_info(order_in_progress=buy_order_in_progress)
+
+        if buy_order_in_progress.info.status == "FILLED":
+            logger.info("The buy order has been filled!")
 
+        elif buy_order_in_progress.info.status == "CANCELED":
+            sys.exit("The buy order has been canceled (not by the script)!")
+
+        return buy_order_in_progress
+
+    async def _poll_order_info(
+        self,
+        order_in_progress: OrderInProgress,
+    ) -> None:
+        """
+        Poll the order info over REST until the order reaches a
+        terminal status. Only used as a fallback when no event is
+        received on the user data stream.
+        Args:
+            order_in_progress (OrderInProgress): Order executed by Binance
+        Return:
+            None
+        """
         NB_MAX_ATTEMPTS = 10
-        ORDER_IS_NOT_FILLED_YET = True
-        while ORDER_IS_NOT_FILLED_YET:
+        delay = POLL_INITIAL_DELAY
+        # Bind the bound method once instead of re-resolving the
+        # attribute on every retry iteration
+        update_order_info = self.update_order_info
+        while True:
             # Iterate few times if the Binance API is not responding
             for retry_number in range(NB_MAX_ATTEMPTS):
                 try:
-                    self.update_order_info(
-                        order_in_progress=buy_order_in_progress
+                    await update_order_info(
+                        order_in_progress=order_in_progress
                     )
+                except BinanceAPIException as e:
+                    if (
+                        e.code == ORDER_NOT_FOUND_ERROR_CODE
+                        and retry_number < len(ORDER_VISIBILITY_DELAYS)
+                    ):
+                        # The order id was echoed back but is not
+                        # queryable yet: not a connection failure
+                        logger.debug("The order is not visible yet...")
+                        await asyncio.sleep(
+                            ORDER_VISIBILITY_DELAYS[retry_number]
+                        )
+                        continue
+                    logger.warning("(%s) Connection failed. Retry... %s", retry_number + 1, e)
+                    await asyncio.sleep(2)
+                    continue
                 except Exception as e:
-                    print(f"({retry_number + 1}) Connection failed. Retry...", e)
-                    time.sleep(2)
+                    logger.warning("(%s) Connection failed. Retry... %s", retry_number + 1, e)
+                    await asyncio.sleep(2)
                     continue
                 else:
                     break
             else:
-                print("Binance API is not responding, attempting to cancel the buy order...")
+                logger.error("Binance API is not responding, attempting to cancel the buy order...")
                 # Cancel order
-                _cancel_result = self.cancel_open_order(
-                    order_in_progress=buy_order_in_progress
+                _cancel_result = await self.cancel_open_order(
+                    order_in_progress=order_in_progress
                 )
                 sys.exit(f"Buy order canceled: {_cancel_result}")
 
-            if buy_order_in_progress.info.status == "FILLED":
-                print("The buy order has been filled!")
+            if order_in_progress.info.status in TERMINAL_ORDER_STATUSES:
                 break
 
-            elif buy_order_in_progress.info.status == "CANCELED":
-                sys.exit("The buy order has been canceled (not by the script)!")
+            logger.debug("The order is not filled yet...")
+            await asyncio.sleep(
+                delay * (1 + random.uniform(-POLL_JITTER, POLL_JITTER))
+            )
+            delay = min(delay * 2, POLL_MAX_DELAY)
 
-            else:
-                print("The order is not filled yet...")
-                time.sleep(3)
+    @staticmethod
+    def _order_info_from_execution_report(
+        order: Order,
+        message: Dict,
+    ) -> Optional[OrderInfo]:
+        """
+        Build the order info straight from an executionReport event,
+        sparing the REST round-trip between fill detection and the OCO
+        submission. The payload carries the order status ("X"), the
+        cumulative filled quantity ("z") and the cumulative quote
+        spent ("Z").
+        Returns None when the price cannot be derived from the event
+        (an unfilled market order), so the caller can fall back to REST.
+        """
+        executed_quantity = Decimal(message["z"])
 
-        return buy_order_in_progress
+        if isinstance(order, LimitOrder):
+            buy_price = order.price
+        elif executed_quantity:
+            # Volume-weighted average price of the fills
+            buy_price = Decimal(message["Z"]) / executed_quantity
+        else:
+            return None
+
+        return OrderInfo(
+            status=message["X"],
+            price=buy_price,
+            cummulative_quote_quantity=message["Z"],
+            executed_quantity=message["z"],
+        )
 
-    def update_order_info(
+    async def update_order_info(
         self,
         order_in_progress: OrderInProgress,
     ) -> None:
         """Get current status of an existing order."""
 
-        order_info_binance = self.binance_client.get_order(
+        order_info_binance = await self.binance_client.get_order(
             symbol=order_in_progress.order.symbol.symbol,
             orderId=order_in_progress.id
         )
@@ -382,55 +788,95 @@ class Client:
         )
         order_in_progress.info = order_info_client
 
-    def execute_sell_strategy(
+    def prepare_sell_oco_order(
+        self,
+        symbol: Symbol,
+        bought_price: Decimal,
+        quantity: Decimal,
+        sell_factors: SellFactors,
+    ) -> OCOOrder:
+        """
+        Build and validate the sell OCO order for a bought price.
+        A limit buy fills at its own price, so this can run
+        speculatively while the fill is awaited, hiding the price math
+        and order validation behind the network wait.
+        Args:
+            symbol (Symbol): Symbol being traded
+            bought_price (Decimal): (Expected) price of the buy order
+            quantity (Decimal): (Expected) executed quantity to sell
+            sell_factors (SellFactors): Precomputed sell price multipliers
+        Return:
+            OCOOrder
+        """
+        # Calculate the selling price with profit, rounded down so the
+        # target never overshoots the requested percentage
+        price_profit = (bought_price * sell_factors.profit_multiplier).quantize(
+            symbol.price_quantum,
+            rounding=ROUND_DOWN
+        )
+        # Calculate the stoploss price, rounded up so the stop never
+        # sits below the requested loss bound
+        price_loss = (bought_price * sell_factors.loss_multiplier).quantize(
+            symbol.price_quantum,
+            rounding=ROUND_UP
+        )
+        return OCOOrder(
+            symbol=symbol,
+            side=ORDER_SIDE_SELL,
+            price=price_profit,
+            quantity=quantity,
+            stop_price=price_loss,
+            stop_limit_price=price_loss,
+            time_in_force=TIME_IN_FORCE_GTC
+        )
+
+    async def execute_sell_strategy(
         self,
         order_in_progress: OrderInProgress,
-        profit: Decimal,
-        loss: Decimal,
+        sell_factors: SellFactors,
+        prepared_oco_order: Optional[OCOOrder] = None,
     ) -> Union[Dict, Dict]:
         """
         Execute the sell strategy.
         Args:
             order_in_progress (OrderInProgress): Order executed by Binance
-            profit (Decimal): Percentage of the profit
-            loss (Decimal): Percentage of the stoploss
+            sell_factors (SellFactors): Precomputed sell price multipliers
+            prepared_oco_order (OCOOrder): OCO order built speculatively
+                before the fill; used when its assumptions held
         Return:
             Dict, Dict
         """
         # Place a sell OCO order
-        print("=> Step 2 - Sell OCO order execution")
+        logger.info("=> Step 2 - Sell OCO order execution")
         bought_price = order_in_progress.info.price
+        executed_quantity = order_in_progress.info.executed_quantity
+        symbol = order_in_progress.order.symbol
 
-        # Calculate the selling price with profit
-        price_profit = round(
-            bought_price * (100 + profit)/100,
-            order_in_progress.order.symbol.price_decimal_precision
-        )
-        price_profit_str = get_formated_price(
-            price_profit,
-            order_in_progress.order.symbol.price_decimal_precision
-        )
-        print(f"Selling price (profit): {price_profit_str}")
-        # Calculate the stoploss price
-        price_loss = round(
-            bought_price * (100 - loss)/100,
-            order_in_progress.order.symbol.price_decimal_precision
-        )
-        price_loss_str = get_formated_price(
-            price_loss,
-            order_in_progress.order.symbol.price_decimal_precision
+        order = order_in_progress.order
+        if (
+            prepared_oco_order is not None
+            and isinstance(order, LimitOrder)
+            and bought_price == order.price
+            and prepared_oco_order.quantity == executed_quantity
+        ):
+            oco_order = prepared_oco_order
+        else:
+            oco_order = self.prepare_sell_oco_order(
+                symbol=symbol,
+                bought_price=bought_price,
+                quantity=executed_quantity,
+                sell_factors=sell_factors,
+            )
+
+        logger.info(
+            "Selling price (profit): %s",
+            get_formated_price(oco_order.price, symbol.price_decimal_precision)
         )
-        print(f"Stoploss price: {price_loss_str}")
-        oco_order = OCOOrder(
-            symbol=order_in_progress.order.symbol,
-            side=Order.SideEnum.sell,
-            price=price_profit,
-            quantity=order_in_progress.info.executed_quantity,
-            stop_price=price_loss,
-            stop_limit_price=price_loss,
-            time_in_force=TIME_IN_FORCE_GTC
+        logger.info(
+            "Stoploss price: %s",
+            get_formated_price(oco_order.stop_price, symbol.price_decimal_precision)
         )
-        sell_order = self.create_sell_oco_order(order=oco_order)
+        sell_order = await self.create_sell_oco_order(order=oco_order)
 
         sell_orders = sell_order["orderReports"]
         stop_loss_limit_order = sell_orders[0]
@@ -1,15 +1,15 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 from typing import Optional
-from .object_values.orders import Order, OrderInfo
 
+from .object_values.orders import Order, OrderInfo
 
-class Entity(BaseModel):
-    class Config:
-        allow_mutation = True
-        validate_assignment = True
+# Entities are mutable in-process records, not validation boundaries:
+# their fields are already-validated objects, so a slotted dataclass
+# keeps construction and attribute access cheap.
 
 
-class OrderInProgress(Entity):
+@dataclass(slots=True)
+class OrderInProgress:
     id: Optional[int]
     order: Order
-    info: Optional[OrderInfo]
+    info: Optional[OrderInfo] = None
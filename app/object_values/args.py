@@ -1,19 +1,17 @@
-from pydantic import condecimal
-
-from .base import ObjectValue
+from .base import ObjectValue, PercentDecimal, PositiveDecimal
 
 
 class InputArgs(ObjectValue):
     symbol: str
     buy_type: str
-    profit: condecimal(gt=0, le=100)
-    loss: condecimal(gt=0, le=100)
+    profit: PercentDecimal
+    loss: PercentDecimal
 
 
 class LimitInputArgs(InputArgs):
-    quantity: condecimal(gt=0)
-    price: condecimal(gt=0)
+    quantity: PositiveDecimal
+    price: PositiveDecimal
 
 
 class MarketInputArgs(InputArgs):
-    total: condecimal(gt=0)
+    total: PositiveDecimal
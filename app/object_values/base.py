@@ -1,7 +1,18 @@
-from pydantic import BaseModel
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared constrained-type aliases: every model reusing one of these
+# shares a single compiled core schema instead of generating its own
+PositiveDecimal = Annotated[Decimal, Field(gt=0)]
+NonNegativeDecimal = Annotated[Decimal, Field(ge=0)]
+PercentDecimal = Annotated[Decimal, Field(gt=0, le=100)]
 
 
 class ObjectValue(BaseModel):
 
-    class Config:
-        allow_mutation = False
+    # revalidate_instances pinned explicitly: an already-built Symbol
+    # passed into each Order must be taken as-is, not re-validated
+    # (filters and all) on every order construction
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
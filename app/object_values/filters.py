@@ -1,33 +1,43 @@
+from dataclasses import dataclass
 from decimal import Decimal
 
-from .base import ObjectValue
+# The filters are frozen slotted dataclasses rather than pydantic
+# models: they are internal containers traversed on every order
+# validation, and slots keep the attribute chains
+# (filters.price_filter.min_price, ...) cheap. The fields are expected
+# to be parsed to Decimal by the caller, once per symbol lifetime.
 
 
-class PriceFilter(ObjectValue):
+@dataclass(frozen=True, slots=True)
+class PriceFilter:
     min_price: Decimal
     max_price: Decimal
     tick_size: Decimal
 
 
-class PercentPriceFilter(ObjectValue):
+@dataclass(frozen=True, slots=True)
+class PercentPriceFilter:
     mul_up: Decimal
     mul_down: Decimal
     avg_price_mins: Decimal
 
 
-class LotSizeFilter(ObjectValue):
+@dataclass(frozen=True, slots=True)
+class LotSizeFilter:
     min_qty: Decimal
     max_qty: Decimal
     step_size: Decimal
 
 
-class MarketLotSizeFilter(ObjectValue):
+@dataclass(frozen=True, slots=True)
+class MarketLotSizeFilter:
     min_qty: Decimal
     max_qty: Decimal
     step_size: Decimal
 
 
-class Filters(ObjectValue):
+@dataclass(frozen=True, slots=True)
+class Filters:
     price_filter: PriceFilter
     percent_price_filter: PercentPriceFilter
     lot_size_filter: LotSizeFilter
@@ -1,144 +1,233 @@
-from enum import Enum
-from pydantic import condecimal, root_validator, validator
 from decimal import Decimal
+from functools import lru_cache
+from typing import ClassVar, Literal, Optional, Tuple, Type
 
-from .base import ObjectValue
-from .symbol import Symbol
-from ..tools import is_valid_significant_digits
+from pydantic import Field, create_model, model_validator
 
+from .base import NonNegativeDecimal, ObjectValue, PositiveDecimal
+from .symbol import (
+    CHECK_MARKET_QTY_STEP,
+    CHECK_PERCENT_BAND,
+    CHECK_PRICE_TICK,
+    CHECK_QTY_STEP,
+    Symbol,
+)
+from ..tools import is_valid_step
 
-class Order(ObjectValue):
 
-    class SideEnum(str, Enum):
-        buy = 'BUY'
-        sell = 'SELL'
+# Kept as plain constants for callers; Literal fields compile to a
+# native string-set membership test instead of an enum lookup
+SIDE_BUY = 'BUY'
+SIDE_SELL = 'SELL'
+
+OrderSide = Literal['BUY', 'SELL']
+
+OrderStatus = Literal[
+    'NEW',
+    'PARTIALLY_FILLED',
+    'FILLED',
+    'CANCELED',
+    'PENDING_CANCEL',
+    'REJECTED',
+    'EXPIRED',
+]
+
+
+class Order(ObjectValue):
 
     symbol: Symbol
-    side: SideEnum
+    side: OrderSide
+
+
+def validate_order(
+    symbol: Symbol,
+    quantity: Decimal,
+    price: Decimal
+) -> None:
+    """
+        Run every price and quantity check for a limit order in a
+        single pass, with the filter attributes bound once.
+        Raises a ValueError naming the failed check.
+    """
+    price_filter = symbol.filters.price_filter
+    lot_size_filter = symbol.filters.lot_size_filter
+    active_checks = symbol._active_checks
+
+    if not price_filter.min_price <= price <= price_filter.max_price:
+        raise ValueError("The price is not in valid range.")
+
+    if active_checks & CHECK_PRICE_TICK and not is_valid_step(
+        price,
+        price_filter.tick_size
+    ):
+        raise ValueError("The price precision is not valid.")
+
+    if active_checks & CHECK_PERCENT_BAND and not (
+        symbol.price_lower_limit <= price <= symbol.price_upper_limit
+    ):
+        raise ValueError("The price is not valid compared to current avg trades.")
+
+    if not lot_size_filter.min_qty <= quantity <= lot_size_filter.max_qty:
+        raise ValueError("The quantity is not in valid range.")
+
+    if active_checks & CHECK_QTY_STEP and not is_valid_step(
+        quantity,
+        lot_size_filter.step_size
+    ):
+        raise ValueError("The quantity precision is not valid.")
 
 
 class MarketOrder(Order):
-    total: condecimal(gt=0) = None
+    total: Optional[PositiveDecimal] = None
 
-    @root_validator
-    def attribute_validation(cls, values: dict) -> dict:
+    @model_validator(mode='after')
+    def attribute_validation(self) -> 'MarketOrder':
         """
             `total` checked against the MARKET_LOT_SIZE_FILTER.
         """
-        if not (total := values.get('total')):
+        if self.total is None:
             raise ValueError("Total attribute is required.")
 
-        if not (symbol := values.get('symbol')):
-            raise ValueError("Symbol attribute is required.")
-
+        symbol = self.symbol
         filter = symbol.filters.market_lot_size_filter
-        if not filter.min_qty <= total <= filter.max_qty:
+        if not filter.min_qty <= self.total <= filter.max_qty:
             raise ValueError("The quantity is not in valid range.")
 
-        if filter.step_size and not is_valid_significant_digits(
-            total,
-            symbol.qty_decimal_precision
+        if symbol._active_checks & CHECK_MARKET_QTY_STEP and not is_valid_step(
+            self.total,
+            filter.step_size
         ):
             raise ValueError("The quantity precision is not valid.")
 
-        return values
+        return self
 
 
 class LimitOrder(Order):
-    price: condecimal(gt=0)
-    quantity: condecimal(gt=0)
-
-    @root_validator(allow_reuse=True)
-    def attribute_validation(cls, values: dict) -> dict:
-        validated_values = cls._validate_price(values, 'price')
-        validated_values = cls._validate_qty(validated_values)
-        return validated_values
-
-    @staticmethod
-    def _validate_price(values: dict, price_attr_name: str):
-        if not (price := values.get(price_attr_name)):
-            raise ValueError("Price attribute is required.")
-
-        if not (symbol := values.get('symbol')):
-            raise ValueError("Symbol attribute is required.")
-
+    price: PositiveDecimal
+    quantity: PositiveDecimal
+
+    # The additional price fields each subclass introduces; the single
+    # validator below walks the tuple so every price is checked exactly
+    # once however deep the subclass sits
+    _extra_price_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @model_validator(mode='after')
+    def attribute_validation(self) -> 'LimitOrder':
+        validate_order(self.symbol, self.quantity, self.price)
+        for price_attr_name in self._extra_price_fields:
+            self._validate_price(price_attr_name)
+        return self
+
+    def _validate_price(self, price_attr_name: str) -> None:
+        price = getattr(self, price_attr_name)
+        symbol = self.symbol
         price_filter = symbol.filters.price_filter
-        percent_price_filter = symbol.filters.percent_price_filter
+        active_checks = symbol._active_checks
 
         if not price_filter.min_price <= price <= price_filter.max_price:
             raise ValueError("The price is not in valid range.")
 
-        if price_filter.tick_size and not is_valid_significant_digits(
+        if active_checks & CHECK_PRICE_TICK and not is_valid_step(
             price,
-            symbol.price_decimal_precision
+            price_filter.tick_size
         ):
             raise ValueError("The price precision is not valid.")
 
-        price_upper_limit = symbol.average_price * percent_price_filter.mul_up
-        price_lower_limit = symbol.average_price * percent_price_filter.mul_down
-
-        if not price_lower_limit <= price <= price_upper_limit:
+        if active_checks & CHECK_PERCENT_BAND and not (
+            symbol.price_lower_limit <= price <= symbol.price_upper_limit
+        ):
             raise ValueError("The price is not valid compared to current avg trades.")
 
-        return values
 
-    @staticmethod
-    def _validate_qty(values: dict):
-        """
-            `quantity` checked against the LOT_SIZE_FILTER.
-        """
-
-        if not (quantity := values.get('quantity')):
-            raise ValueError("Quantity attribute is required.")
-
-        if not (symbol := values.get('symbol')):
-            raise ValueError("Symbol attribute is required.")
+class StopLimitOrder(LimitOrder):
+    stop_price: PositiveDecimal
+    time_in_force: str
 
-        filter = symbol.filters.lot_size_filter
-        if not filter.min_qty <= quantity <= filter.max_qty:
-            ValueError("The quantity is not in valid range.")
+    _extra_price_fields = ('stop_price',)
 
-        if filter.step_size and not is_valid_significant_digits(
-            quantity,
-            symbol.qty_decimal_precision
-        ):
-            raise ValueError("The quantity precision is not valid.")
-
-        return values
 
+class OCOOrder(StopLimitOrder):
+    stop_limit_price: PositiveDecimal
 
-class StopLimitOrder(LimitOrder):
-    stop_price: condecimal(gt=0)
-    time_in_force: str
+    _extra_price_fields = ('stop_price', 'stop_limit_price')
 
-    @root_validator(allow_reuse=True)
-    def attribute_validation(cls, values: dict) -> dict:
-        validated_values = super().attribute_validation(values)
-        validated_values = cls._validate_price(validated_values, 'stop_price')
-        return validated_values
 
+def _passthrough_validation(self):
+    # The specialized classes carry every check as a field constraint,
+    # so the inherited Python validator has nothing left to do
+    return self
 
-class OCOOrder(StopLimitOrder):
-    stop_limit_price: condecimal(gt=0)
 
-    @root_validator(allow_reuse=True)
-    def attribute_validation(cls, values: dict) -> dict:
-        validated_values = super().attribute_validation(values)
-        validated_values = cls._validate_price(validated_values, 'stop_limit_price')
-        return validated_values
+@lru_cache(maxsize=256)
+def order_types_for_symbol(
+    symbol: Symbol
+) -> Tuple[Type[LimitOrder], Type[MarketOrder]]:
+    """
+        Build LimitOrder/MarketOrder subclasses specialized for one
+        symbol: the filter bounds, percent-price band and tick/step
+        sizes are inlined as field constraints, so pydantic-core runs
+        every check natively and the Python validator pass is skipped.
+        Cached per symbol; the classes still satisfy the isinstance
+        dispatch in the client.
+    """
+    filters = symbol.filters
+    price_filter = filters.price_filter
+    lot_size_filter = filters.lot_size_filter
+    market_lot_size_filter = filters.market_lot_size_filter
+    active_checks = symbol._active_checks
+
+    price_constraints = {
+        'ge': price_filter.min_price,
+        'le': price_filter.max_price,
+    }
+    if active_checks & CHECK_PERCENT_BAND:
+        price_constraints['ge'] = max(
+            price_constraints['ge'], symbol.price_lower_limit
+        )
+        price_constraints['le'] = min(
+            price_constraints['le'], symbol.price_upper_limit
+        )
+    if active_checks & CHECK_PRICE_TICK:
+        price_constraints['multiple_of'] = price_filter.tick_size
+
+    qty_constraints = {
+        'ge': lot_size_filter.min_qty,
+        'le': lot_size_filter.max_qty,
+    }
+    if active_checks & CHECK_QTY_STEP:
+        qty_constraints['multiple_of'] = lot_size_filter.step_size
+
+    total_constraints = {
+        'ge': market_lot_size_filter.min_qty,
+        'le': market_lot_size_filter.max_qty,
+    }
+    if active_checks & CHECK_MARKET_QTY_STEP:
+        total_constraints['multiple_of'] = market_lot_size_filter.step_size
+
+    limit_order_type = create_model(
+        f'LimitOrder_{symbol.symbol}',
+        __base__=LimitOrder,
+        __validators__={
+            'attribute_validation':
+                model_validator(mode='after')(_passthrough_validation),
+        },
+        price=(Decimal, Field(**price_constraints)),
+        quantity=(Decimal, Field(**qty_constraints)),
+    )
+    market_order_type = create_model(
+        f'MarketOrder_{symbol.symbol}',
+        __base__=MarketOrder,
+        __validators__={
+            'attribute_validation':
+                model_validator(mode='after')(_passthrough_validation),
+        },
+        total=(Decimal, Field(**total_constraints)),
+    )
+    return limit_order_type, market_order_type
 
 
 class OrderInfo(ObjectValue):
-    class StatusEnum(str, Enum):
-        new = 'NEW'
-        partially_filled = 'PARTIALLY_FILLED'
-        filled = 'FILLED'
-        canceled = 'CANCELED'
-        pending_cancel = 'PENDING_CANCEL'
-        rejected = 'REJECTED'
-        expired = 'EXPIRED'
-
-    status: StatusEnum
-    price: condecimal(gt=0)
-    cummulative_quote_quantity: condecimal(ge=0)
-    executed_quantity: condecimal(ge=0)
+    status: OrderStatus
+    price: PositiveDecimal
+    cummulative_quote_quantity: NonNegativeDecimal
+    executed_quantity: NonNegativeDecimal
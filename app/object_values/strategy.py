@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+from .base import ObjectValue
+
+# Cached reciprocal so percentages multiply instead of divide
+ONE_PERCENT = Decimal("0.01")
+
+
+class SellFactors(ObjectValue):
+    """
+    Price multipliers of the sell strategy, derived once from the
+    profit and stoploss percentages for the lifetime of the run.
+    """
+    profit_multiplier: Decimal
+    loss_multiplier: Decimal
+
+    @classmethod
+    def from_percentages(
+        cls,
+        profit: Decimal,
+        loss: Decimal,
+    ) -> "SellFactors":
+        """
+        Build the factors from percentages between 0 and 100.
+        Args:
+            profit (Decimal): Percentage of the profit
+            loss (Decimal): Percentage of the stoploss
+        Return:
+            SellFactors
+        """
+        return cls(
+            profit_multiplier=1 + profit * ONE_PERCENT,
+            loss_multiplier=1 - loss * ONE_PERCENT,
+        )
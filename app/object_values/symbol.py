@@ -1,25 +1,51 @@
-from pydantic import Field, validator
+from dataclasses import dataclass, field
 from decimal import Decimal
 
-from .base import ObjectValue
 from .filters import (
     Filters
 )
-from ..tools import strict_integer_validator
 
+# Bits of the Symbol._active_checks bitmap. A filter whose tick/step or
+# percent multiplier is zero is disabled on Binance's side; the order
+# validators test the bit instead of re-deriving that from the Decimals
+CHECK_PRICE_TICK = 1
+CHECK_PERCENT_BAND = 2
+CHECK_QTY_STEP = 4
+CHECK_MARKET_QTY_STEP = 8
 
-class Symbol(ObjectValue):
+
+# Like the filters it carries, the symbol is built once per run by the
+# client from already-parsed values and then only read on the per-order
+# hot path, so a frozen slotted dataclass keeps every attribute chain
+# a C-level slot fetch instead of a dict probe.
+@dataclass(frozen=True, slots=True)
+class Symbol:
     symbol: str
     status: str
     baseAsset: str
     quoteAsset: str
     isSpotTradingAllowed: bool
     ocoAllowed: bool
-    price_decimal_precision: int = Field(..., ge=0)
-    qty_decimal_precision: int = Field(..., ge=0)
+    price_decimal_precision: int
+    qty_decimal_precision: int
+    price_quantum: Decimal
     average_price: Decimal
+    # Percent-price band, precomputed from the average price so the
+    # validators do not repeat the multiplications on every check
+    price_lower_limit: Decimal
+    price_upper_limit: Decimal
     filters: Filters
 
-    @validator('price_decimal_precision', 'qty_decimal_precision')
-    def enforce_strict_integer_validation(cls, v):
-        return strict_integer_validator(cls, v)
+    _active_checks: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        if self.price_decimal_precision < 0 or self.qty_decimal_precision < 0:
+            raise ValueError("The decimal precisions must be non-negative.")
+
+        filters = self.filters
+        object.__setattr__(self, '_active_checks', (
+            (filters.price_filter.tick_size != 0) * CHECK_PRICE_TICK
+            | (filters.percent_price_filter.mul_up != 0) * CHECK_PERCENT_BAND
+            | (filters.lot_size_filter.step_size != 0) * CHECK_QTY_STEP
+            | (filters.market_lot_size_filter.step_size != 0) * CHECK_MARKET_QTY_STEP
+        ))
@@ -1,43 +1,49 @@
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
 
 DEFAULT_DECIMAL_PLACES = 2
 
+DEFAULT_ISO8601_TEMPLATE = '%Y-%m-%d %H:%M:%SZ'
+
+
+@lru_cache(maxsize=32)
+def _quantum(precision: int) -> Decimal:
+    """One Decimal quantum per precision, built once."""
+    return Decimal(1).scaleb(-precision)
+
 
 def get_formated_price(
     amount: Decimal,
     precision: int = DEFAULT_DECIMAL_PLACES
 ) -> str:
     """
-    Format the price with a precision
+    Format the price with a precision, truncating the excess digits
+    (prices are never rounded up when displayed)
     Args:
-        amount (Float): Amount to format
+        amount (Decimal): Amount to format
         precision (Integer): Precision to use
     Return:
         formated price (String)
     """
-    return "{:0.0{}f}".format(amount, precision)
+    return format(
+        amount.quantize(_quantum(precision), rounding=ROUND_DOWN),
+        'f'
+    )
 
 
 def datetime_to_iso8601(
     datetime_to_convert: datetime,
-    iso8601_template: str = '%Y-%m-%d %H:%M:%SZ'
+    iso8601_template: str = DEFAULT_ISO8601_TEMPLATE
 ) -> str:
     "Convert a datetime to a string in iso8601 format"
+    if iso8601_template is DEFAULT_ISO8601_TEMPLATE:
+        # isoformat builds the default layout in C, without a
+        # strftime format-string parse
+        return datetime_to_convert.isoformat(sep=' ', timespec='seconds') + 'Z'
     return datetime_to_convert.strftime(iso8601_template)
 
 
-def strict_integer_validator(cls, v: Any) -> int:
-    """
-    Casts a value `v` as an integer if it represents exactly an integer.
-    Otherwise throw a `ValueError`
-    """
-    if int(v) != Decimal(v):
-        raise ValueError
-    return int(v)
-
-
 def decimal_precision_from_scientific_notation(decimal_value: Decimal) -> int:
     """
     Retrieve the decimal precision of a Decimal of the strict form 10^n
@@ -48,21 +54,28 @@ def decimal_precision_from_scientific_notation(decimal_value: Decimal) -> int:
         0.00001 <=> 10^-5 => decimal_precision = 5
         0.000011 != 10^n => ValueError
     """
-    return strict_integer_validator(
-        None,
-        -decimal_value.log10()
-    )
+    normalized_tuple = decimal_value.normalize().as_tuple()
+    if normalized_tuple.digits != (1,):
+        raise ValueError
+    return -normalized_tuple.exponent
 
 
-def is_valid_significant_digits(
+# Cached: the OCO validation chain checks the same (price, step)
+# pair several times per order, and Decimals hash by value
+@lru_cache(maxsize=1024)
+def is_valid_step(
     value: Decimal,
-    max_significant_digits: int
+    step: Decimal
 ) -> bool:
     """
-        Are the significant digits with a lower precision than the accepted limit.
-        >>> is_valid_significant_digits(Decimal(0.001), 3)
+        Is the value an exact multiple of the filter's tick/step size.
+        Pure integer arithmetic, no Decimal context round-trip, and it
+        does not assume the step is a power of ten.
+        >>> is_valid_step(Decimal("0.003"), Decimal("0.001"))
         ... True
-        >>> is_valid_significant_digits(Decimal(0.0011), 3)
+        >>> is_valid_step(Decimal("0.0011"), Decimal("0.001"))
         ... False
     """
-    return round(value, max_significant_digits) == value
+    value_num, value_den = value.as_integer_ratio()
+    step_num, step_den = step.as_integer_ratio()
+    return (value_num * step_den) % (step_num * value_den) == 0